@@ -4,22 +4,79 @@ FastAPI server for UI Accessibility Analyzer
 Simplified version focusing only on UI modifications.
 """
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from dataclasses import asdict
 
 from ui_accessibility_analyzer import (
-    UIAccessibilityAnalyzer, 
-    DisabilityType
+    UIAccessibilityAnalyzer,
+    DisabilityType,
+    UIElement,
+    UIModification,
+    AccessibilityProfile
 )
 
+# Optional Redis support: with multiple uvicorn workers a per-process
+# dict means every worker pays the first-miss LLM cost, so share the
+# cache when redis is available. Falls back to in-process caching.
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared per-process resources before serving traffic"""
+    # Bound the thread pool used by asyncio.to_thread so slow LLM calls
+    # can't pile up unbounded threads; the event loop itself stays free
+    # to serve health checks and cache hits while calls are in flight.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=16, thread_name_prefix="analyzer")
+    )
+
+    app.state.analyzer = None
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("❌ Failed to initialize analyzer: OPENAI_API_KEY environment variable not set")
+    else:
+        try:
+            app.state.analyzer = UIAccessibilityAnalyzer(api_key)
+            print("✅ UI Accessibility Analyzer initialized successfully")
+        except Exception as e:
+            print(f"❌ Failed to initialize analyzer: {e}")
+
+    # Optionally precompute responses for every disability type so the
+    # first real request for each is already a cache hit. Gated by env
+    # var so dev reloads stay fast.
+    if app.state.analyzer is not None and os.getenv("WARM_CACHE") == "1":
+        print("🔥 Warming response cache for all disability types...")
+        await asyncio.gather(
+            *[_get_full(app.state.analyzer, dt) for dt in DisabilityType],
+            return_exceptions=True
+        )
+        print(f"✅ Response cache warmed ({len(response_cache)} entries)")
+
+    yield
+
 # Initialize FastAPI app
 app = FastAPI(
     title="UI Accessibility Analyzer API",
     description="API for analyzing UI components and generating accessibility modifications",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -31,16 +88,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (react_modifications and generated CSS can
+# run to many KB); small responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Pydantic models
 class AnalyzeRequest(BaseModel):
     disability_type: str
 
+class BatchAnalyzeRequest(BaseModel):
+    disability_types: List[str]
+
 class UIModificationResponse(BaseModel):
     disability_type: str
     css_modifications: str
     react_modifications: Dict[str, Any]
     summary: str
 
+class CSSResponse(BaseModel):
+    disability_type: str
+    css: str
+    css_class: str
+
+class ReactResponse(BaseModel):
+    disability_type: str
+    modifications: Dict[str, Any]
+
+class DisabilityTypeInfo(BaseModel):
+    value: str
+    name: str
+
+class DisabilityTypesResponse(BaseModel):
+    disability_types: List[DisabilityTypeInfo]
+
+class RootResponse(BaseModel):
+    message: str
+    version: str
+    endpoints: Dict[str, str]
+
 class ComponentDefinition(BaseModel):
     component_name: str
     element_type: str
@@ -49,161 +134,492 @@ class ComponentDefinition(BaseModel):
     css_property: str
     importance: str
 
-class UpdateComponentsRequest(BaseModel):
-    components: Dict[str, List[ComponentDefinition]]
+# Compiled once at import; reused by /components/update so each request
+# runs the pydantic-core validator directly instead of rebuilding the
+# nested model through FastAPI's per-call machinery
+_COMPONENTS_ADAPTER = TypeAdapter(Dict[str, List[ComponentDefinition]])
 
-# Global analyzer instance
-analyzer: Optional[UIAccessibilityAnalyzer] = None
+# Static payloads are immutable for the process lifetime, so serialize
+# them once at import and serve the cached bytes on every request
+_ROOT_PAYLOAD = {
+    "message": "UI Accessibility Analyzer API",
+    "version": "1.0.0",
+    "endpoints": {
+        "analyze": "/analyze",
+        "analyze_batch": "/analyze/batch",
+        "css": "/css/{disability_type}",
+        "react": "/react/{disability_type}",
+        "disability_types": "/disability-types",
+        "update_components": "/components/update"
+    }
+}
+_ROOT_JSON = orjson.dumps(_ROOT_PAYLOAD)
 
-def get_analyzer() -> UIAccessibilityAnalyzer:
-    """Get or create the analyzer instance"""
-    global analyzer
-    if analyzer is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise HTTPException(
-                status_code=500, 
-                detail="OPENAI_API_KEY environment variable not set"
+_DISABILITY_TYPES_PAYLOAD = {
+    "disability_types": [
+        {
+            "value": dt.value,
+            "name": dt.value.replace("_", " ").title()
+        }
+        for dt in DisabilityType
+    ]
+}
+_DISABILITY_TYPES_JSON = orjson.dumps(_DISABILITY_TYPES_PAYLOAD)
+
+# O(1) validation lookup plus a pre-built error template, so bad input
+# costs a dict miss and one %-format instead of exception-driven control
+# flow and rebuilding the valid-values list every time
+_VALID_DISABILITY_TYPES = {dt.value: dt for dt in DisabilityType}
+_CSS_CLASS = {dt.value: f"persona-{dt.value.replace('_', '-')}" for dt in DisabilityType}
+_INVALID_TYPE_MSG = (
+    f"Invalid disability type: %s. Valid types: {list(_VALID_DISABILITY_TYPES)}"
+)
+
+# Shared cross-worker cache client (None when redis isn't installed or
+# stops responding). Entries expire after a day; the components version
+# is part of every key so component updates invalidate implicitly.
+_redis = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost")) if aioredis else None
+_REDIS_TTL = 86400
+_components_version = 0
+
+def _cache_key(disability_type: DisabilityType) -> str:
+    return f"uiacc:{_components_version}:{disability_type.value}"
+
+def _profile_to_dict(profile: AccessibilityProfile) -> dict:
+    """Serialize an AccessibilityProfile to plain JSON-safe types"""
+    data = asdict(profile)
+    data["disability_type"] = profile.disability_type.value
+    return data
+
+def _profile_from_dict(data: dict) -> AccessibilityProfile:
+    """Rebuild an AccessibilityProfile from its serialized form"""
+    return AccessibilityProfile(
+        disability_type=DisabilityType(data["disability_type"]),
+        modifications=[
+            UIModification(
+                element=UIElement(**mod["element"]),
+                new_value=mod["new_value"],
+                reasoning=mod["reasoning"],
+                priority=mod["priority"]
             )
-        analyzer = UIAccessibilityAnalyzer(api_key)
+            for mod in data["modifications"]
+        ],
+        css_classes=data["css_classes"],
+        content_adaptations=data["content_adaptations"],
+        summary=data["summary"]
+    )
+
+async def _redis_get(disability_type: DisabilityType) -> Optional[tuple]:
+    """Fetch a cached analysis from Redis, disabling Redis on failure"""
+    global _redis
+    if _redis is None:
+        return None
+    try:
+        raw = await _redis.get(_cache_key(disability_type))
+    except Exception as e:
+        print(f"⚠️  Redis unavailable, using in-process cache only: {e}")
+        _redis = None
+        return None
+    if raw is None:
+        return None
+    data = orjson.loads(raw)
+    return (_profile_from_dict(data["profile"]), data["css"], data["react"])
+
+# The version lives in Redis so a bump by any worker invalidates all of
+# them; each process mirrors it in _components_version and drops its
+# local caches when the shared value moves.
+_VERSION_KEY = "uiacc:components-version"
+
+async def _sync_version() -> None:
+    """Adopt the shared components version, dropping stale local caches"""
+    global _redis, _components_version
+    if _redis is None:
+        return
+    try:
+        raw = await _redis.get(_VERSION_KEY)
+    except Exception as e:
+        print(f"⚠️  Redis unavailable, using in-process cache only: {e}")
+        _redis = None
+        return
+    shared = int(raw) if raw is not None else 0
+    if shared != _components_version:
+        _components_version = shared
+        response_cache.clear()
+        _css_etag.clear()
+
+async def _bump_version() -> None:
+    """Advance the components version, preferring the shared counter"""
+    global _redis, _components_version
+    if _redis is not None:
+        try:
+            _components_version = int(await _redis.incr(_VERSION_KEY))
+            return
+        except Exception as e:
+            print(f"⚠️  Redis unavailable, using in-process cache only: {e}")
+            _redis = None
+    _components_version += 1
+
+async def _redis_set(disability_type: DisabilityType, result: tuple) -> None:
+    """Store a built analysis in Redis with a TTL"""
+    global _redis
+    if _redis is None:
+        return
+    profile, css, react_mods = result
+    payload = orjson.dumps({
+        "profile": _profile_to_dict(profile),
+        "css": css,
+        "react": react_mods
+    })
+    try:
+        await _redis.setex(_cache_key(disability_type), _REDIS_TTL, payload)
+    except Exception as e:
+        print(f"⚠️  Redis unavailable, using in-process cache only: {e}")
+        _redis = None
+
+# Response cache: disability_type value -> (profile, css, react_mods).
+# The input space is the small closed DisabilityType enum, so caching the
+# complete analysis lets repeat requests skip the LLM round-trip entirely.
+# All endpoints share this one cache, so /css followed by /react costs a
+# single analyze pass instead of two.
+response_cache: Dict[str, tuple] = {}
+
+# Strong ETags for the deterministic per-type CSS payloads, so browsers
+# revalidating with If-None-Match get a bodyless 304 instead of a
+# redownload. Cleared together with the response cache.
+_css_etag: Dict[str, str] = {}
+
+def analyzer_dep(request: Request) -> UIAccessibilityAnalyzer:
+    """Dependency returning the analyzer bound to the application state"""
+    analyzer = request.app.state.analyzer
+    if analyzer is None:
+        raise HTTPException(
+            status_code=500,
+            detail="OPENAI_API_KEY environment variable not set"
+        )
     return analyzer
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the analyzer on startup"""
+def _is_fallback(profile: AccessibilityProfile) -> bool:
+    """True for the degraded profile served when GPT analysis fails"""
+    return profile.summary.startswith("Fallback profile")
+
+def _build_full(analyzer: UIAccessibilityAnalyzer, disability_type: DisabilityType) -> tuple:
+    """Run the full analysis once and cache (profile, css, react_mods)"""
+    cached = response_cache.get(disability_type.value)
+    if cached is not None:
+        return cached
+
+    profile = analyzer.analyze_disability_type(disability_type)
+    css = analyzer.generate_css_modifications(profile)
+    react_mods = analyzer.generate_react_modifications(profile)
+
+    result = (profile, css, react_mods)
+    # A transient API failure yields a fallback profile; caching it would
+    # pin the degraded response until the next invalidation
+    if not _is_fallback(profile):
+        response_cache[disability_type.value] = result
+    return result
+
+# In-flight futures for single-flight deduplication: if N concurrent
+# requests arrive for the same uncached disability type, only the first
+# runs the LLM call and the rest await its result.
+_inflight: Dict[str, asyncio.Future] = {}
+_inflight_lock: Optional[asyncio.Lock] = None
+
+def _get_inflight_lock() -> asyncio.Lock:
+    """Create the lock lazily so it binds to the running event loop"""
+    global _inflight_lock
+    if _inflight_lock is None:
+        _inflight_lock = asyncio.Lock()
+    return _inflight_lock
+
+async def _get_full(analyzer: UIAccessibilityAnalyzer, disability_type: DisabilityType) -> tuple:
+    """Await the cached analysis, sharing one build across concurrent callers"""
+    # Another worker may have invalidated; one Redis GET keeps the local
+    # caches honest and is far cheaper than serving a stale analysis
+    await _sync_version()
+
+    key = disability_type.value
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    lock = _get_inflight_lock()
+    async with lock:
+        # Re-check under the lock: another coroutine may have finished
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+        future = _inflight.get(key)
+        if future is not None:
+            is_owner = False
+        else:
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            is_owner = True
+
+    if not is_owner:
+        return await future
+
     try:
-        get_analyzer()
-        print("✅ UI Accessibility Analyzer initialized successfully")
+        # Another worker process may have built this already
+        result = await _redis_get(disability_type)
+        if result is not None:
+            response_cache[key] = result
+        else:
+            result = await asyncio.to_thread(_build_full, analyzer, disability_type)
+            if not _is_fallback(result[0]):
+                await _redis_set(disability_type, result)
+        future.set_result(result)
+        return result
     except Exception as e:
-        print(f"❌ Failed to initialize analyzer: {e}")
+        future.set_exception(e)
+        raise
+    finally:
+        async with lock:
+            _inflight.pop(key, None)
 
-@app.get("/")
+@app.get("/", response_model=RootResponse)
 async def root():
     """Root endpoint"""
-    return {
-        "message": "UI Accessibility Analyzer API",
-        "version": "1.0.0",
-        "endpoints": {
-            "analyze": "/analyze",
-            "css": "/css/{disability_type}",
-            "react": "/react/{disability_type}",
-            "disability_types": "/disability-types",
-            "update_components": "/components/update"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
-    try:
-        get_analyzer()
+    if request.app.state.analyzer is not None:
         return {"status": "healthy"}
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
+    return {"status": "unhealthy", "error": "OPENAI_API_KEY environment variable not set"}
 
-@app.get("/disability-types")
+@app.get("/disability-types", response_model=DisabilityTypesResponse)
 async def get_disability_types():
     """Get list of supported disability types"""
-    return {
-        "disability_types": [
-            {
-                "value": dt.value,
-                "name": dt.value.replace("_", " ").title()
-            }
-            for dt in DisabilityType
-        ]
-    }
+    return Response(content=_DISABILITY_TYPES_JSON, media_type="application/json")
 
 @app.post("/analyze", response_model=UIModificationResponse)
-async def analyze_disability_type(request: AnalyzeRequest):
+async def analyze_disability_type(
+    request: AnalyzeRequest,
+    analyzer: UIAccessibilityAnalyzer = Depends(analyzer_dep)
+):
     """Analyze UI modifications for a specific disability type"""
     try:
         # Validate disability type
-        try:
-            disability_type = DisabilityType(request.disability_type)
-        except ValueError:
+        disability_type = _VALID_DISABILITY_TYPES.get(request.disability_type)
+        if disability_type is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid disability type: {request.disability_type}. Valid types: {[dt.value for dt in DisabilityType]}"
+                detail=_INVALID_TYPE_MSG % request.disability_type
             )
-        
-        # Get analyzer and perform analysis
-        analyzer = get_analyzer()
-        profile = analyzer.analyze_disability_type(disability_type)
-        
-        # Generate CSS and React modifications
-        css = analyzer.generate_css_modifications(profile)
-        react_mods = analyzer.generate_react_modifications(profile)
-        
+
+        # Build the response (cached and deduplicated per disability type)
+        profile, css, react_mods = await _get_full(analyzer, disability_type)
+
         return UIModificationResponse(
             disability_type=profile.disability_type.value,
             css_modifications=css,
             react_modifications=react_mods,
             summary=profile.summary
         )
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-@app.get("/css/{disability_type}")
-async def get_css_modifications(disability_type: str):
+@app.post("/analyze/batch", response_model=List[UIModificationResponse])
+async def analyze_disability_types_batch(
+    request: BatchAnalyzeRequest,
+    analyzer: UIAccessibilityAnalyzer = Depends(analyzer_dep)
+):
+    """Analyze UI modifications for several disability types in one call"""
+    try:
+        # Validate all disability types up front
+        disability_types = []
+        for value in request.disability_types:
+            dt = _VALID_DISABILITY_TYPES.get(value)
+            if dt is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=_INVALID_TYPE_MSG % value
+                )
+            disability_types.append(dt)
+
+        # Run the analyses concurrently, capped so a large batch can't
+        # blow past OpenAI concurrency limits. Cache hits return instantly.
+        semaphore = asyncio.Semaphore(8)
+
+        async def bounded_get(dt: DisabilityType) -> tuple:
+            async with semaphore:
+                return await _get_full(analyzer, dt)
+
+        results = await asyncio.gather(*[bounded_get(dt) for dt in disability_types])
+
+        return [
+            UIModificationResponse(
+                disability_type=profile.disability_type.value,
+                css_modifications=css,
+                react_modifications=react_mods,
+                summary=profile.summary
+            )
+            for profile, css, react_mods in results
+        ]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
+
+@app.get("/css/{disability_type}", response_model=CSSResponse)
+async def get_css_modifications(
+    disability_type: str,
+    request: Request,
+    response: Response,
+    analyzer: UIAccessibilityAnalyzer = Depends(analyzer_dep)
+):
     """Get CSS modifications for a disability type"""
     try:
         # Validate disability type
-        try:
-            dt = DisabilityType(disability_type)
-        except ValueError:
+        dt = _VALID_DISABILITY_TYPES.get(disability_type)
+        if dt is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid disability type: {disability_type}"
+                detail=_INVALID_TYPE_MSG % disability_type
             )
+
+        # Slice the CSS from the shared cached analysis
+        _, css, _ = await _get_full(analyzer, dt)
+
+        etag = _css_etag.get(dt.value)
+        if etag is None:
+            etag = hashlib.blake2b(css.encode(), digest_size=16).hexdigest()
+            _css_etag[dt.value] = etag
+
+        # Short-circuit revalidation requests with an empty 304
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "public, max-age=3600"
+
+        return CSSResponse(
+            disability_type=disability_type,
+            css=css,
+            css_class=_CSS_CLASS[disability_type]
+        )
         
-        # Get analyzer and generate CSS
-        analyzer = get_analyzer()
-        profile = analyzer.analyze_disability_type(dt)
-        css = analyzer.generate_css_modifications(profile)
-        
-        return {
-            "disability_type": disability_type,
-            "css": css,
-            "css_class": f"persona-{disability_type.replace('_', '-')}"
-        }
-        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate CSS: {str(e)}")
 
-@app.get("/react/{disability_type}")
-async def get_react_modifications(disability_type: str):
+@app.get("/react/{disability_type}", response_model=ReactResponse)
+async def get_react_modifications(
+    disability_type: str,
+    analyzer: UIAccessibilityAnalyzer = Depends(analyzer_dep)
+):
     """Get React modifications for a disability type"""
     try:
         # Validate disability type
-        try:
-            dt = DisabilityType(disability_type)
-        except ValueError:
+        dt = _VALID_DISABILITY_TYPES.get(disability_type)
+        if dt is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid disability type: {disability_type}"
+                detail=_INVALID_TYPE_MSG % disability_type
             )
+
+        # Slice the React modifications from the shared cached analysis
+        _, _, react_mods = await _get_full(analyzer, dt)
+
+        return ReactResponse(
+            disability_type=disability_type,
+            modifications=react_mods
+        )
         
-        # Get analyzer and generate React modifications
-        analyzer = get_analyzer()
-        profile = analyzer.analyze_disability_type(dt)
-        react_mods = analyzer.generate_react_modifications(profile)
-        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to generate React modifications: {str(e)}")
+
+@app.post("/cache/invalidate")
+async def invalidate_cache():
+    """Clear the cached responses (use after changing UI components)"""
+    cleared = len(response_cache)
+    response_cache.clear()
+    _css_etag.clear()
+    # Bumping the shared version changes every Redis key (stale entries
+    # age out) and makes the other workers drop their local caches on
+    # their next version check
+    await _bump_version()
+    return {"message": "Response cache cleared", "cleared_entries": cleared}
+
+@app.post("/components/update")
+async def update_components(
+    request: Request,
+    analyzer: UIAccessibilityAnalyzer = Depends(analyzer_dep)
+):
+    """Update the UI component definitions and invalidate cached responses.
+
+    The component definitions themselves live on this process's analyzer,
+    so with multiple uvicorn workers run this against each worker (or
+    restart the pool); the version bump below only invalidates caches.
+    """
+    # Decode and shape-check the body before the broad handler below so
+    # client mistakes surface as 400s rather than 500s
+    try:
+        raw = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+    if not isinstance(raw, dict) or "components" not in raw:
+        raise HTTPException(status_code=400, detail="Missing 'components' field")
+
+    try:
+        try:
+            components_by_category = _COMPONENTS_ADAPTER.validate_python(raw["components"])
+        except Exception as ve:
+            raise HTTPException(status_code=400, detail=f"Invalid components: {ve}")
+
+        # Convert Pydantic models back to analyzer UIElement instances
+        for category, components in components_by_category.items():
+            analyzer.ui_components[category] = [
+                UIElement(
+                    component_name=comp.component_name,
+                    element_type=comp.element_type,
+                    current_value=comp.current_value,
+                    description=comp.description,
+                    css_property=comp.css_property,
+                    importance=comp.importance
+                )
+                for comp in components
+            ]
+
+        # Re-derive the analyzer's prompt and cache-key state so new
+        # analyses actually see the new components
+        analyzer.refresh_components()
+
+        # Cached responses were built against the old components
+        response_cache.clear()
+        _css_etag.clear()
+        await _bump_version()
+
         return {
-            "disability_type": disability_type,
-            "modifications": react_mods
+            "message": "Components updated successfully",
+            "updated_categories": list(components_by_category.keys()),
+            "total_categories": len(analyzer.ui_components)
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate React modifications: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to update components: {str(e)}")
 
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "api_server:app",
+        "main_backend_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+        reload=False,
+        log_level="info",
+        loop="uvloop",
+        http="httptools"
     )
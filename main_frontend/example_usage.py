@@ -4,9 +4,25 @@ Example usage of the UI Accessibility Analyzer
 This script demonstrates how to use the analyzer for a specific disability type.
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from ui_accessibility_analyzer import UIAccessibilityAnalyzer, DisabilityType
 
+# orjson encodes at C speed; fall back to stdlib json when unavailable
+try:
+    import orjson
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 def analyze_single_disability():
     """Analyze UI modifications for a single disability type"""
     
@@ -52,8 +68,7 @@ def analyze_single_disability():
     print(f"\nReact Modifications:")
     print("-" * 30)
     react_mods = analyzer.generate_react_modifications(profile)
-    import json
-    print(json.dumps(react_mods, indent=2))
+    print(_json_pretty(react_mods))
     
     # Save reports
     analyzer.save_analysis_report(profile)
@@ -77,25 +92,44 @@ def analyze_multiple_disabilities():
         DisabilityType.COGNITIVE_IMPAIRMENT
     ]
     
-    for disability_type in disability_types:
-        print(f"\n{'='*60}")
-        print(f"Analyzing: {disability_type.value}")
-        print(f"{'='*60}")
-        
-        profile = analyzer.analyze_disability_type(disability_type)
-        
-        print(f"Summary: {profile.summary}")
-        print(f"Modifications: {len(profile.modifications)}")
-        
-        # Show high priority modifications only
-        high_priority = [mod for mod in profile.modifications if mod.priority <= 2]
-        if high_priority:
-            print(f"\nHigh Priority Changes:")
-            for mod in high_priority:
-                print(f"- {mod.element.component_name}: {mod.current_value} → {mod.new_value}")
-        
-        # Save reports
-        analyzer.save_analysis_report(profile)
+    # The analyses are independent OpenAI calls (I/O-bound), so overlap
+    # them in a thread pool instead of paying each latency in sequence
+    with ThreadPoolExecutor(max_workers=len(disability_types)) as executor:
+        profiles = dict(zip(
+            disability_types,
+            executor.map(analyzer.analyze_disability_type, disability_types)
+        ))
+
+        # Print and save in a serial second pass so output stays ordered;
+        # each section is buffered and flushed as one write instead of
+        # one syscall per print line
+        save_futures = []
+        for disability_type, profile in profiles.items():
+            buf = io.StringIO()
+            buf.write(f"\n{'='*60}\n")
+            buf.write(f"Analyzing: {disability_type.value}\n")
+            buf.write(f"{'='*60}\n")
+
+            buf.write(f"Summary: {profile.summary}\n")
+            buf.write(f"Modifications: {len(profile.modifications)}\n")
+
+            # Show high priority modifications only
+            high_priority = [mod for mod in profile.modifications if mod.priority <= 2]
+            if high_priority:
+                buf.write("\nHigh Priority Changes:\n")
+                for mod in high_priority:
+                    buf.write(f"- {mod.element.component_name}: {mod.element.current_value} → {mod.new_value}\n")
+
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+
+            # Save reports (disk I/O, so overlap it too)
+            save_futures.append(executor.submit(analyzer.save_analysis_report, profile))
+
+        # Collect the futures so save failures raise instead of being
+        # silently dropped with the fire-and-forget handles
+        for future in save_futures:
+            future.result()
 
 def compare_disability_types():
     """Compare modifications across different disability types"""
@@ -107,34 +141,39 @@ def compare_disability_types():
     
     analyzer = UIAccessibilityAnalyzer(api_key)
     
-    # Analyze all disability types
-    profiles = {}
-    for disability_type in DisabilityType:
-        print(f"Analyzing {disability_type.value}...")
-        profiles[disability_type] = analyzer.analyze_disability_type(disability_type)
-    
-    # Compare results
-    print(f"\n{'='*80}")
-    print("COMPARISON OF DISABILITY TYPES")
-    print(f"{'='*80}")
-    
+    # Analyze all disability types concurrently (each is an independent
+    # OpenAI call, so wall time drops to roughly the slowest request)
+    targets = list(DisabilityType)
+    print(f"Analyzing {len(targets)} disability types in parallel...")
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        profiles = dict(zip(targets, executor.map(analyzer.analyze_disability_type, targets)))
+
+    # Compare results, buffering the whole report into one write
+    buf = io.StringIO()
+    buf.write(f"\n{'='*80}\n")
+    buf.write("COMPARISON OF DISABILITY TYPES\n")
+    buf.write(f"{'='*80}\n")
+
     for disability_type, profile in profiles.items():
-        print(f"\n{disability_type.value.upper()}:")
-        print(f"  Summary: {profile.summary}")
-        print(f"  Total modifications: {len(profile.modifications)}")
-        
+        buf.write(f"\n{disability_type.value.upper()}:\n")
+        buf.write(f"  Summary: {profile.summary}\n")
+        buf.write(f"  Total modifications: {len(profile.modifications)}\n")
+
         # Count modifications by type
         typography_count = len([mod for mod in profile.modifications if mod.element.css_property in ['font-size', 'font-weight', 'line-height']])
         color_count = len([mod for mod in profile.modifications if mod.element.css_property in ['color', 'background-color']])
         layout_count = len([mod for mod in profile.modifications if mod.element.css_property in ['padding', 'margin', 'gap', 'display']])
-        
-        print(f"  Typography changes: {typography_count}")
-        print(f"  Color changes: {color_count}")
-        print(f"  Layout changes: {layout_count}")
-    
-    # Save all reports
-    for disability_type, profile in profiles.items():
-        analyzer.save_analysis_report(profile)
+
+        buf.write(f"  Typography changes: {typography_count}\n")
+        buf.write(f"  Color changes: {color_count}\n")
+        buf.write(f"  Layout changes: {layout_count}\n")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+    # Save all reports (disk I/O, also worth overlapping)
+    with ThreadPoolExecutor(max_workers=len(profiles)) as executor:
+        list(executor.map(analyzer.save_analysis_report, profiles.values()))
 
 if __name__ == "__main__":
     print("UI Accessibility Analyzer - Example Usage")
@@ -1,87 +1,91 @@
 #!/usr/bin/env python3
 """
 Simple test script for the UI Accessibility Analyzer API
+Runs the independent endpoint tests concurrently so total wall time is
+bounded by the slowest endpoint instead of the sum of all of them.
 """
 
-import requests
+import asyncio
 import json
 
+import httpx
+
 # API base URL
 BASE_URL = "http://localhost:8000"
 
-def test_health():
+async def test_health(client: httpx.AsyncClient) -> str:
     """Test health endpoint"""
-    print("🔍 Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
+    lines = ["🔍 Testing health endpoint..."]
+    response = await client.get("/health")
+    lines.append(f"Status: {response.status_code}")
+    lines.append(f"Response: {response.json()}")
+    return "\n".join(lines)
 
-def test_disability_types():
+async def test_disability_types(client: httpx.AsyncClient) -> str:
     """Test disability types endpoint"""
-    print("🔍 Testing disability types endpoint...")
-    response = requests.get(f"{BASE_URL}/disability-types")
-    print(f"Status: {response.status_code}")
-    print("Available disability types:")
+    lines = ["🔍 Testing disability types endpoint..."]
+    response = await client.get("/disability-types")
+    lines.append(f"Status: {response.status_code}")
+    lines.append("Available disability types:")
     for dt in response.json()["disability_types"]:
-        print(f"  - {dt['value']}: {dt['name']}")
-    print()
+        lines.append(f"  - {dt['value']}: {dt['name']}")
+    return "\n".join(lines)
 
-def test_analyze_disability():
+async def test_analyze_disability(client: httpx.AsyncClient) -> str:
     """Test analyze endpoint"""
-    print("🔍 Testing analyze endpoint for dyslexia...")
+    lines = ["🔍 Testing analyze endpoint for dyslexia..."]
     data = {"disability_type": "dyslexia"}
-    response = requests.post(f"{BASE_URL}/analyze", json=data)
-    print(f"Status: {response.status_code}")
-    
+    response = await client.post("/analyze", json=data)
+    lines.append(f"Status: {response.status_code}")
+
     if response.status_code == 200:
         result = response.json()
-        print(f"Disability Type: {result['disability_type']}")
-        print(f"Summary: {result['summary']}")
-        print(f"CSS Class: persona-{result['disability_type'].replace('_', '-')}")
-        print("\nCSS Modifications:")
-        print(result['css_modifications'])
-        print("\nReact Modifications:")
-        print(json.dumps(result['react_modifications'], indent=2))
+        lines.append(f"Disability Type: {result['disability_type']}")
+        lines.append(f"Summary: {result['summary']}")
+        lines.append(f"CSS Class: persona-{result['disability_type'].replace('_', '-')}")
+        lines.append("\nCSS Modifications:")
+        lines.append(result['css_modifications'])
+        lines.append("\nReact Modifications:")
+        lines.append(json.dumps(result['react_modifications'], indent=2))
     else:
-        print(f"Error: {response.text}")
-    print()
+        lines.append(f"Error: {response.text}")
+    return "\n".join(lines)
 
-def test_css_endpoint():
+async def test_css_endpoint(client: httpx.AsyncClient) -> str:
     """Test CSS endpoint"""
-    print("🔍 Testing CSS endpoint for low_vision...")
-    response = requests.get(f"{BASE_URL}/css/low_vision")
-    print(f"Status: {response.status_code}")
-    
+    lines = ["🔍 Testing CSS endpoint for low_vision..."]
+    response = await client.get("/css/low_vision")
+    lines.append(f"Status: {response.status_code}")
+
     if response.status_code == 200:
         result = response.json()
-        print(f"Disability Type: {result['disability_type']}")
-        print(f"CSS Class: {result['css_class']}")
-        print("\nCSS:")
-        print(result['css'])
+        lines.append(f"Disability Type: {result['disability_type']}")
+        lines.append(f"CSS Class: {result['css_class']}")
+        lines.append("\nCSS:")
+        lines.append(result['css'])
     else:
-        print(f"Error: {response.text}")
-    print()
+        lines.append(f"Error: {response.text}")
+    return "\n".join(lines)
 
-def test_react_endpoint():
+async def test_react_endpoint(client: httpx.AsyncClient) -> str:
     """Test React endpoint"""
-    print("🔍 Testing React endpoint for cognitive_impairment...")
-    response = requests.get(f"{BASE_URL}/react/cognitive_impairment")
-    print(f"Status: {response.status_code}")
-    
+    lines = ["🔍 Testing React endpoint for cognitive_impairment..."]
+    response = await client.get("/react/cognitive_impairment")
+    lines.append(f"Status: {response.status_code}")
+
     if response.status_code == 200:
         result = response.json()
-        print(f"Disability Type: {result['disability_type']}")
-        print("\nReact Modifications:")
-        print(json.dumps(result['modifications'], indent=2))
+        lines.append(f"Disability Type: {result['disability_type']}")
+        lines.append("\nReact Modifications:")
+        lines.append(json.dumps(result['modifications'], indent=2))
     else:
-        print(f"Error: {response.text}")
-    print()
+        lines.append(f"Error: {response.text}")
+    return "\n".join(lines)
 
-def test_update_components():
+async def test_update_components(client: httpx.AsyncClient) -> str:
     """Test component update endpoint"""
-    print("🔍 Testing component update endpoint...")
-    
+    lines = ["🔍 Testing component update endpoint..."]
+
     # Example new component
     new_components = {
         "typography": [
@@ -95,39 +99,53 @@ def test_update_components():
             }
         ]
     }
-    
-    response = requests.post(f"{BASE_URL}/components/update", json={"components": new_components})
-    print(f"Status: {response.status_code}")
-    
+
+    response = await client.post("/components/update", json={"components": new_components})
+    lines.append(f"Status: {response.status_code}")
+
     if response.status_code == 200:
         result = response.json()
-        print(f"Message: {result['message']}")
-        print(f"Updated categories: {result['updated_categories']}")
-        print(f"Total categories: {result['total_categories']}")
+        lines.append(f"Message: {result['message']}")
+        lines.append(f"Updated categories: {result['updated_categories']}")
+        lines.append(f"Total categories: {result['total_categories']}")
     else:
-        print(f"Error: {response.text}")
-    print()
+        lines.append(f"Error: {response.text}")
+    return "\n".join(lines)
 
-def main():
-    """Run all tests"""
+async def run_tests():
+    """Run all tests concurrently against a shared client"""
     print("🚀 Testing UI Accessibility Analyzer API")
     print("=" * 50)
-    
+
     try:
-        test_health()
-        test_disability_types()
-        test_analyze_disability()
-        test_css_endpoint()
-        test_react_endpoint()
-        test_update_components()
-        
+        # One shared client with keep-alive pooling, so repeated calls
+        # reuse sockets instead of paying connect/accept per request
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+        async with httpx.AsyncClient(base_url=BASE_URL, timeout=120.0, limits=limits) as client:
+            reports = await asyncio.gather(
+                test_health(client),
+                test_disability_types(client),
+                test_analyze_disability(client),
+                test_css_endpoint(client),
+                test_react_endpoint(client),
+                test_update_components(client),
+            )
+
+        for report in reports:
+            print(report)
+            print()
+
         print("✅ All tests completed!")
-        
-    except requests.exceptions.ConnectionError:
+
+    except httpx.ConnectError:
         print("❌ Could not connect to API server.")
         print("Make sure the server is running with: python api_server.py")
     except Exception as e:
         print(f"❌ Test failed: {e}")
 
+def main():
+    """Entry point"""
+    asyncio.run(run_tests())
+
 if __name__ == "__main__":
     main()
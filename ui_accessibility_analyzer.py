@@ -4,14 +4,55 @@ UI Accessibility Analyzer for Claire & George CMS
 Uses GPT-5 to analyze UI components and determine modifications for different disability types.
 """
 
+import asyncio
+import hashlib
+import io
 import json
+from collections import defaultdict
+import time
 import openai
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import os
 from pathlib import Path
 
+# orjson serializes and parses the multi-KB prompt/response payloads at
+# C speed; fall back to stdlib json when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+# Transient API failures worth retrying before degrading to the
+# fallback profile; backoff doubles per attempt, capped at 30s
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.InternalServerError)
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF = 30.0
+
+# Bump when the analysis prompt changes so stale cached analyses are
+# not reused
+PROMPT_VERSION = "v1"
+
+# Where GPT analyses are cached across runs; repeat invocations with the
+# same components return instantly and cost nothing
+CACHE_DIR = Path(".accessibility_cache")
+
 # Enums for disability types
 class DisabilityType(str, Enum):
     WHEELCHAIR_USER = "wheelchair_user"
@@ -20,7 +61,14 @@ class DisabilityType(str, Enum):
     ANXIETY_TRAVEL_FEAR = "anxiety_travel_fear"
     LOW_VISION = "low_vision"
 
-@dataclass
+# Derived display strings are constant per member, so attach them once
+# instead of re-running str.replace at every call site
+for _member in DisabilityType:
+    _member.css_suffix = _member.value.replace('_', '-')
+    _member.human = _member.value.replace('_', ' ')
+del _member
+
+@dataclass(slots=True)
 class UIElement:
     """Represents a UI element that can be modified"""
     component_name: str
@@ -30,7 +78,7 @@ class UIElement:
     css_property: str
     importance: str  # "high", "medium", "low"
 
-@dataclass
+@dataclass(slots=True)
 class UIModification:
     """Represents a modification to a UI element"""
     element: UIElement
@@ -38,7 +86,7 @@ class UIModification:
     reasoning: str
     priority: int  # 1-5, where 1 is highest priority
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityProfile:
     """Complete accessibility profile for a disability type"""
     disability_type: DisabilityType
@@ -47,121 +95,51 @@ class AccessibilityProfile:
     content_adaptations: List[str]
     summary: str
 
-class UIAccessibilityAnalyzer:
-    def __init__(self, api_key: str):
-        """Initialize the analyzer with OpenAI API key"""
-        self.client = openai.OpenAI(api_key=api_key)
-        
-        # Define the UI components and elements identified from the codebase
-        self.ui_components = self._define_ui_components()
-    
-    def _define_ui_components(self) -> Dict[str, List[UIElement]]:
-        """Define the UI components and elements found in the codebase"""
-        return {
-            "typography": [
-                UIElement("h1", "heading", "text-4xl md:text-6xl font-bold", "Main page headings", "font-size", "high"),
-                UIElement("h2", "heading", "text-4xl font-bold", "Section headings", "font-size", "high"),
-                UIElement("h3", "heading", "text-2xl font-bold", "Card titles", "font-size", "medium"),
-                UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
-                UIElement("button", "text", "font-medium", "Button text", "font-weight", "medium"),
-                UIElement("link", "text", "hover:underline", "Navigation links", "text-decoration", "medium"),
-                UIElement("description", "text", "text-muted-foreground", "Descriptive text", "color", "medium"),
-            ],
-            "layout": [
-                UIElement("card", "container", "p-6", "Card padding", "padding", "medium"),
-                UIElement("section", "container", "py-16", "Section spacing", "padding", "medium"),
-                UIElement("grid", "layout", "grid md:grid-cols-3 gap-8", "Grid layout", "display", "high"),
-                UIElement("navigation", "container", "space-x-8", "Navigation spacing", "gap", "medium"),
-            ],
-            "colors": [
-                UIElement("primary", "color", "hsl(336 75% 45%)", "Primary brand color", "color", "high"),
-                UIElement("background", "color", "hsl(0 0% 100%)", "Background color", "background-color", "high"),
-                UIElement("foreground", "color", "hsl(210 11% 15%)", "Text color", "color", "high"),
-                UIElement("muted", "color", "hsl(210 11% 64%)", "Muted text color", "color", "medium"),
-                UIElement("border", "color", "hsl(210 12% 90%)", "Border color", "border-color", "low"),
-            ],
-            "interactive": [
-                UIElement("button", "interactive", "px-8 py-3", "Button padding", "padding", "high"),
-                UIElement("button", "interactive", "hover:bg-white/10", "Button hover state", "background-color", "medium"),
-                UIElement("link", "interactive", "hover:text-primary", "Link hover state", "color", "medium"),
-                UIElement("card", "interactive", "hover:shadow-alpine", "Card hover effect", "box-shadow", "low"),
-            ],
-            "spacing": [
-                UIElement("container", "spacing", "px-4", "Container padding", "padding", "medium"),
-                UIElement("section", "spacing", "mb-8", "Section margin bottom", "margin", "medium"),
-                UIElement("element", "spacing", "gap-2", "Element gap", "gap", "low"),
-            ]
-        }
-    
-    def analyze_disability_type(self, disability_type: DisabilityType) -> AccessibilityProfile:
-        """Analyze UI modifications needed for a specific disability type"""
-        
-        # Create the prompt for GPT-5
-        prompt = self._create_analysis_prompt(disability_type)
-        
-        try:
-            # Call GPT-5 for analysis
-            response = self.client.chat.completions.create(
-                model="gpt-4o",  # Using GPT-4o as GPT-5 is not yet available
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert in web accessibility and UI design. You analyze UI components and provide specific recommendations for different disability types."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=2000
-            )
-            
-            # Parse the response
-            analysis_result = self._parse_gpt_response(response.choices[0].message.content, disability_type)
-            return analysis_result
-            
-        except Exception as e:
-            print(f"Error analyzing disability type {disability_type}: {e}")
-            return self._create_fallback_profile(disability_type)
-    
-    def _create_analysis_prompt(self, disability_type: DisabilityType) -> str:
-        """Create a detailed prompt for GPT-5 analysis"""
-        
-        disability_info = {
-            DisabilityType.WHEELCHAIR_USER: {
-                "description": "Users with mobility impairments who use wheelchairs",
-                "needs": "Clear navigation, accessible button sizes, good contrast, logical information hierarchy"
-            },
-            DisabilityType.DYSLEXIA: {
-                "description": "Users with reading difficulties",
-                "needs": "Dyslexia-friendly fonts, increased line spacing, high contrast, simple layouts, reduced cognitive load"
-            },
-            DisabilityType.COGNITIVE_IMPAIRMENT: {
-                "description": "Users with cognitive disabilities or learning difficulties",
-                "needs": "Simple layouts, clear navigation, reduced distractions, consistent design patterns, step-by-step processes"
-            },
-            DisabilityType.ANXIETY_TRAVEL_FEAR: {
-                "description": "Users with anxiety or travel-related fears",
-                "needs": "Calming color schemes, clear information, reduced visual clutter, reassuring content, easy navigation"
-            },
-            DisabilityType.LOW_VISION: {
-                "description": "Users with visual impairments but not completely blind",
-                "needs": "High contrast colors, larger text sizes, clear visual hierarchy, good spacing, readable fonts"
-            }
-        }
-        
-        info = disability_info[disability_type]
-        
-        prompt = f"""
-        Analyze the UI components for accessibility modifications needed for users with {disability_type.value.replace('_', ' ')}.
+# Per-type background for the analysis prompt; constant, so built once
+# at import instead of on every prompt
+_DISABILITY_INFO: Dict[DisabilityType, Dict[str, str]] = {
+    DisabilityType.WHEELCHAIR_USER: {
+        "description": "Users with mobility impairments who use wheelchairs",
+        "needs": "Clear navigation, accessible button sizes, good contrast, logical information hierarchy"
+    },
+    DisabilityType.DYSLEXIA: {
+        "description": "Users with reading difficulties",
+        "needs": "Dyslexia-friendly fonts, increased line spacing, high contrast, simple layouts, reduced cognitive load"
+    },
+    DisabilityType.COGNITIVE_IMPAIRMENT: {
+        "description": "Users with cognitive disabilities or learning difficulties",
+        "needs": "Simple layouts, clear navigation, reduced distractions, consistent design patterns, step-by-step processes"
+    },
+    DisabilityType.ANXIETY_TRAVEL_FEAR: {
+        "description": "Users with anxiety or travel-related fears",
+        "needs": "Calming color schemes, clear information, reduced visual clutter, reassuring content, easy navigation"
+    },
+    DisabilityType.LOW_VISION: {
+        "description": "Users with visual impairments but not completely blind",
+        "needs": "High contrast colors, larger text sizes, clear visual hierarchy, good spacing, readable fonts"
+    }
+}
 
-        Disability Information:
-        - Description: {info['description']}
-        - Key Needs: {info['needs']}
+# Fully-formatted prompt fragment per type, derived once at import so
+# prompt construction is a plain lookup
+_DISABILITY_PROMPTS: Dict[DisabilityType, str] = {
+    disability_type: (
+        f"- Description: {info['description']}\n"
+        f"        - Key Needs: {info['needs']}"
+    )
+    for disability_type, info in _DISABILITY_INFO.items()
+}
 
+# System role shared by the interactive and batch paths
+_SYSTEM_PROMPT = "You are an expert in web accessibility and UI design. You analyze UI components and provide specific recommendations for different disability types. Respond with JSON."
+
+# The prompt is split so the bulky part (components + instructions) is a
+# byte-identical prefix across all five disability types; OpenAI prompt
+# caching matches on shared prefixes, cutting cost and time-to-first-token
+# for every call after the first. Only the short suffix varies per type.
+_PROMPT_STATIC_TEMPLATE = """
         Available UI Components and Elements:
-        {json.dumps(self._format_components_for_prompt(), indent=2)}
+        {components}
 
         Please provide a comprehensive analysis including:
 
@@ -199,44 +177,470 @@ class UIAccessibilityAnalyzer:
             "summary": "brief summary of key changes"
         }}
         """
-        
-        return prompt
-    
+
+_PROMPT_DYNAMIC_TEMPLATE = """
+        Analyze the UI components above for accessibility modifications needed for users with {human}.
+
+        Disability Information:
+        {info}
+        """
+
+# The UI component inventory is static, so build it once at import
+# instead of on every analyzer construction; tuples keep it immutable
+_UI_COMPONENTS: Dict[str, Tuple[UIElement, ...]] = {
+    "typography": (
+        UIElement("h1", "heading", "text-4xl md:text-6xl font-bold", "Main page headings", "font-size", "high"),
+        UIElement("h2", "heading", "text-4xl font-bold", "Section headings", "font-size", "high"),
+        UIElement("h3", "heading", "text-2xl font-bold", "Card titles", "font-size", "medium"),
+        UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
+        UIElement("button", "text", "font-medium", "Button text", "font-weight", "medium"),
+        UIElement("link", "text", "hover:underline", "Navigation links", "text-decoration", "medium"),
+        UIElement("description", "text", "text-muted-foreground", "Descriptive text", "color", "medium"),
+    ),
+    "layout": (
+        UIElement("card", "container", "p-6", "Card padding", "padding", "medium"),
+        UIElement("section", "container", "py-16", "Section spacing", "padding", "medium"),
+        UIElement("grid", "layout", "grid md:grid-cols-3 gap-8", "Grid layout", "display", "high"),
+        UIElement("navigation", "container", "space-x-8", "Navigation spacing", "gap", "medium"),
+    ),
+    "colors": (
+        UIElement("primary", "color", "hsl(336 75% 45%)", "Primary brand color", "color", "high"),
+        UIElement("background", "color", "hsl(0 0% 100%)", "Background color", "background-color", "high"),
+        UIElement("foreground", "color", "hsl(210 11% 15%)", "Text color", "color", "high"),
+        UIElement("muted", "color", "hsl(210 11% 64%)", "Muted text color", "color", "medium"),
+        UIElement("border", "color", "hsl(210 12% 90%)", "Border color", "border-color", "low"),
+    ),
+    "interactive": (
+        UIElement("button", "interactive", "px-8 py-3", "Button padding", "padding", "high"),
+        UIElement("button", "interactive", "hover:bg-white/10", "Button hover state", "background-color", "medium"),
+        UIElement("link", "interactive", "hover:text-primary", "Link hover state", "color", "medium"),
+        UIElement("card", "interactive", "hover:shadow-alpine", "Card hover effect", "box-shadow", "low"),
+    ),
+    "spacing": (
+        UIElement("container", "spacing", "px-4", "Container padding", "padding", "medium"),
+        UIElement("section", "spacing", "mb-8", "Section margin bottom", "margin", "medium"),
+        UIElement("element", "spacing", "gap-2", "Element gap", "gap", "low"),
+    )
+}
+
+# Property categories for React modifications; frozensets so the per-
+# modification membership checks are hash lookups
+_STYLE_PROPS = frozenset({"font-size", "color", "background-color", "padding", "margin"})
+_CLASS_PROPS = frozenset({"display", "gap"})
+
+# CSS properties the generator is allowed to emit; set membership replaces
+# a branch per property
+_ALLOWED_CSS_PROPS = frozenset({
+    "font-size", "color", "background-color", "padding", "margin", "gap",
+    "display", "font-weight", "line-height", "text-decoration", "box-shadow",
+    "border-color"
+})
+
+def _ue_dict(element: "UIElement") -> Dict[str, str]:
+    """Hand-rolled UIElement serializer; dataclasses.asdict deep-copies
+    and reflects over fields, which is needless for this flat dataclass"""
+    return {
+        "component_name": element.component_name,
+        "element_type": element.element_type,
+        "current_value": element.current_value,
+        "description": element.description,
+        "css_property": element.css_property,
+        "importance": element.importance
+    }
+
+def _profile_to_dict(profile: "AccessibilityProfile") -> Dict[str, Any]:
+    """Serialize an AccessibilityProfile to plain JSON-safe types"""
+    data = asdict(profile)
+    data["disability_type"] = profile.disability_type.value
+    return data
+
+def _profile_from_dict(data: Dict[str, Any]) -> "AccessibilityProfile":
+    """Rebuild an AccessibilityProfile from its serialized form"""
+    return AccessibilityProfile(
+        disability_type=DisabilityType(data["disability_type"]),
+        modifications=[
+            UIModification(
+                element=UIElement(**mod["element"]),
+                new_value=mod["new_value"],
+                reasoning=mod["reasoning"],
+                priority=mod["priority"]
+            )
+            for mod in data["modifications"]
+        ],
+        css_classes=data["css_classes"],
+        content_adaptations=data["content_adaptations"],
+        summary=data["summary"]
+    )
+
+
+# Degraded profiles served when GPT analysis fails, built once at import
+# so a failure storm doesn't re-allocate them per call
+_FALLBACKS: Dict[DisabilityType, Tuple[UIModification, ...]] = {
+    DisabilityType.LOW_VISION: (
+        UIModification(
+            element=UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
+            new_value="text-xl",
+            reasoning="Larger text for better readability",
+            priority=1
+        ),
+        UIModification(
+            element=UIElement("primary", "color", "hsl(336 75% 45%)", "Primary brand color", "color", "high"),
+            new_value="hsl(50 100% 60%)",
+            reasoning="High contrast yellow for better visibility",
+            priority=1
+        )
+    ),
+    DisabilityType.DYSLEXIA: (
+        UIModification(
+            element=UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
+            new_value="text-xl leading-relaxed",
+            reasoning="Larger text with increased line spacing for dyslexia",
+            priority=1
+        ),
+    ),
+    DisabilityType.COGNITIVE_IMPAIRMENT: (
+        UIModification(
+            element=UIElement("grid", "layout", "grid md:grid-cols-3 gap-8", "Grid layout", "display", "high"),
+            new_value="grid md:grid-cols-2 gap-12",
+            reasoning="Simplified layout with fewer columns and more spacing",
+            priority=1
+        ),
+    )
+}
+
+class ModificationTable:
+    """Columnar (structure-of-arrays) view of a profile's modifications.
+
+    With hundreds of modifications across personas and pages, per-object
+    attribute access on UIModification instances dominates generation
+    cost. The table stores each field as a parallel list so scans touch
+    contiguous columns, while __getitem__ keeps the dataclass API
+    available by rebuilding a UIModification on demand.
+    """
+
+    __slots__ = ("elements", "new_values", "reasonings", "priorities")
+
+    def __init__(self, profile: AccessibilityProfile):
+        mods = profile.modifications
+        self.elements: List[UIElement] = [mod.element for mod in mods]
+        self.new_values: List[str] = [mod.new_value for mod in mods]
+        self.reasonings: List[str] = [mod.reasoning for mod in mods]
+        self.priorities: List[int] = [mod.priority for mod in mods]
+
+    def __len__(self) -> int:
+        return len(self.new_values)
+
+    def __getitem__(self, index: int) -> UIModification:
+        return UIModification(
+            element=self.elements[index],
+            new_value=self.new_values[index],
+            reasoning=self.reasonings[index],
+            priority=self.priorities[index]
+        )
+
+    def css_declarations(self) -> Dict[str, List[str]]:
+        """Group new values by CSS property in one scan over the columns.
+
+        Fully typed so the loop stays eligible for AOT compilation
+        (mypyc/Cython) if the module ever gains a build step.
+        """
+        groups: Dict[str, List[str]] = defaultdict(list)
+        element: UIElement
+        new_value: str
+        for element, new_value in zip(self.elements, self.new_values):
+            prop: str = element.css_property
+            if prop in _ALLOWED_CSS_PROPS:
+                groups[prop].append(new_value)
+        return groups
+
+    def to_css(self, disability_type: DisabilityType) -> str:
+        """Emit the persona CSS block, streaming into one buffer rather
+        than collecting a list of f-strings and joining"""
+        buf = io.StringIO()
+        buf.write(".persona-")
+        buf.write(disability_type.css_suffix)
+        buf.write(" {\n")
+
+        prop: str
+        values: List[str]
+        for prop, values in self.css_declarations().items():
+            for value in values:
+                buf.write("  ")
+                buf.write(prop)
+                buf.write(": ")
+                buf.write(value)
+                buf.write(";\n")
+
+        buf.write("}")
+        return buf.getvalue()
+
+
+class UIAccessibilityAnalyzer:
+    def __init__(self, api_key: str):
+        """Initialize the analyzer with OpenAI API key"""
+        self.client = openai.OpenAI(api_key=api_key)
+        self.async_client = openai.AsyncOpenAI(api_key=api_key)
+
+        # Shallow-copy the static component table so per-instance updates
+        # (e.g. the /components/update endpoint) don't touch the shared
+        # module constant
+        self.ui_components: Dict[str, Any] = dict(_UI_COMPONENTS)
+
+        self._memory_cache: Dict[str, AccessibilityProfile] = {}
+        self.refresh_components()
+
+    def refresh_components(self) -> None:
+        """Recompute the prompt and cache-key state derived from ui_components.
+
+        Must be called after mutating ui_components (e.g. the server's
+        /components/update endpoint); the new hash keys analyses of the
+        new components away from cached pre-update profiles.
+        """
+        # The components block of the prompt is invariant across disability
+        # types, so serialize it once here instead of on every call
+        formatted_components = self._format_components_for_prompt()
+        self._components_json = _json_dumps(formatted_components, indent=True)
+
+        # Cache key covers everything that influences an analysis:
+        # the components, the model, and the prompt version
+        self._components_hash = hashlib.sha256(
+            _json_dumps(formatted_components, sort_keys=True).encode()
+        ).hexdigest()
+
+        # Rendered once so every request reuses the exact same prefix
+        # bytes, keeping it eligible for server-side prompt caching
+        self._static_prompt = _PROMPT_STATIC_TEMPLATE.format_map({
+            "components": self._components_json
+        })
+
+    def _cache_key(self, disability_type: DisabilityType) -> str:
+        """Build the cache key for one disability type analysis"""
+        return f"{disability_type.value}-{self._components_hash[:16]}-gpt-4o-{PROMPT_VERSION}"
+
+    def _cache_get(self, disability_type: DisabilityType) -> Optional[AccessibilityProfile]:
+        """Look up a cached analysis, in memory first, then on disk"""
+        key = self._cache_key(disability_type)
+        profile = self._memory_cache.get(key)
+        if profile is not None:
+            return profile
+
+        cache_file = CACHE_DIR / f"{key}.json"
+        try:
+            if cache_file.exists():
+                profile = _profile_from_dict(_json_loads(cache_file.read_text()))
+                self._memory_cache[key] = profile
+                return profile
+        except Exception as e:
+            print(f"Warning: ignoring unreadable cache entry {cache_file}: {e}")
+        return None
+
+    def _cache_put(self, disability_type: DisabilityType, profile: AccessibilityProfile) -> None:
+        """Persist a successful analysis in memory and on disk"""
+        key = self._cache_key(disability_type)
+        self._memory_cache[key] = profile
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            (CACHE_DIR / f"{key}.json").write_text(_json_dumps(_profile_to_dict(profile)))
+        except Exception as e:
+            print(f"Warning: failed to write analysis cache: {e}")
+
+    def _request_kwargs(self, disability_type: DisabilityType) -> Dict[str, Any]:
+        """Build the chat-completion arguments shared by both clients.
+
+        The static components/instructions message precedes the per-type
+        suffix so all five requests share one cacheable prompt prefix.
+        """
+        return {
+            "model": "gpt-4o",  # Using GPT-4o as GPT-5 is not yet available
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": self._static_prompt
+                },
+                {
+                    "role": "user",
+                    "content": _PROMPT_DYNAMIC_TEMPLATE.format_map({
+                        "human": disability_type.human,
+                        "info": _DISABILITY_PROMPTS[disability_type]
+                    })
+                }
+            ],
+            "temperature": 0.3,
+            "max_tokens": 2000,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _call_gpt(self, disability_type: DisabilityType):
+        """Call the chat API, retrying transient failures with backoff.
+
+        Rate limits, timeouts and 5xx responses usually clear within
+        seconds, so burning the paid attempt into a fallback profile
+        wastes it; non-retryable errors (e.g. BadRequestError) are
+        raised immediately for the caller to handle.
+        """
+        delay = 1.0
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return self.client.chat.completions.create(**self._request_kwargs(disability_type))
+            except _RETRYABLE_ERRORS as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                print(f"Transient API error (attempt {attempt}/{_MAX_ATTEMPTS}), retrying in {delay:.0f}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, _MAX_BACKOFF)
+
+    async def _call_gpt_async(self, disability_type: DisabilityType):
+        """Async counterpart of _call_gpt with non-blocking backoff"""
+        delay = 1.0
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return await self.async_client.chat.completions.create(**self._request_kwargs(disability_type))
+            except _RETRYABLE_ERRORS as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                print(f"Transient API error (attempt {attempt}/{_MAX_ATTEMPTS}), retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_BACKOFF)
+
+    def analyze_disability_type(self, disability_type: DisabilityType) -> AccessibilityProfile:
+        """Analyze UI modifications needed for a specific disability type"""
+
+        # Serve repeat analyses from the cache instead of re-calling GPT
+        cached = self._cache_get(disability_type)
+        if cached is not None:
+            return cached
+
+        try:
+            # Call GPT-5 for analysis, retrying transient failures
+            response = self._call_gpt(disability_type)
+
+            # Parse the response
+            analysis_result = self._parse_gpt_response(response.choices[0].message.content, disability_type)
+            if not analysis_result.summary.startswith("Fallback profile"):
+                self._cache_put(disability_type, analysis_result)
+            return analysis_result
+
+        except Exception as e:
+            print(f"Error analyzing disability type {disability_type}: {e}")
+            return self._create_fallback_profile(disability_type)
+
+    async def analyze_disability_type_async(self, disability_type: DisabilityType) -> AccessibilityProfile:
+        """Async variant of analyze_disability_type for concurrent analysis"""
+
+        # Serve repeat analyses from the cache instead of re-calling GPT
+        cached = self._cache_get(disability_type)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._call_gpt_async(disability_type)
+
+            analysis_result = self._parse_gpt_response(response.choices[0].message.content, disability_type)
+            if not analysis_result.summary.startswith("Fallback profile"):
+                self._cache_put(disability_type, analysis_result)
+            return analysis_result
+
+        except Exception as e:
+            print(f"Error analyzing disability type {disability_type}: {e}")
+            return self._create_fallback_profile(disability_type)
+
+    def analyze_all_batch(self, disability_types: Optional[List[DisabilityType]] = None,
+                          poll_interval: float = 30.0) -> Dict[DisabilityType, AccessibilityProfile]:
+        """Analyze disability types offline via the OpenAI Batch API.
+
+        Batch runs cost half the synchronous price and draw from a separate
+        rate-limit pool, at the cost of latency (up to the 24h completion
+        window), so this suits offline analyzer sweeps rather than
+        interactive use. Falls back per type when a result is missing.
+        """
+        if disability_types is None:
+            disability_types = list(DisabilityType)
+
+        # One JSONL request line per disability type, keyed by custom_id
+        lines = []
+        for disability_type in disability_types:
+            lines.append(_json_dumps({
+                "custom_id": disability_type.value,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_kwargs(disability_type)
+            }))
+
+        input_file = self.client.files.create(
+            file=("accessibility_analysis_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        # Poll until the batch reaches a terminal state
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        results = {}
+        if batch.status == "completed" and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = _json_loads(line)
+                disability_type = DisabilityType(entry["custom_id"])
+                response_body = entry.get("response", {}).get("body", {})
+                choices = response_body.get("choices", [])
+                if choices:
+                    results[disability_type] = self._parse_gpt_response(
+                        choices[0]["message"]["content"], disability_type
+                    )
+        else:
+            print(f"Batch {batch.id} ended with status {batch.status}")
+
+        # Fall back for any type the batch did not return
+        for disability_type in disability_types:
+            if disability_type not in results:
+                results[disability_type] = self._create_fallback_profile(disability_type)
+
+        return results
+
     def _format_components_for_prompt(self) -> Dict[str, List[Dict]]:
         """Format UI components for the GPT prompt"""
         formatted = {}
         for category, elements in self.ui_components.items():
-            formatted[category] = [asdict(element) for element in elements]
+            formatted[category] = [_ue_dict(element) for element in elements]
         return formatted
     
     def _parse_gpt_response(self, response_text: str, disability_type: DisabilityType) -> AccessibilityProfile:
         """Parse the GPT response into an AccessibilityProfile"""
         try:
-            # Extract JSON from response
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            json_str = response_text[json_start:json_end]
-            
-            data = json.loads(json_str)
+            # JSON mode guarantees a bare JSON object, so parse directly;
+            # a malformed reply raises and lands in the fallback below
+            data = _json_loads(response_text)
             
             # Convert modifications back to UIModification objects
             modifications = []
             for mod_data in data.get('modifications', []):
                 element_data = mod_data['element']
                 element = UIElement(
-                    component_name=element_data['component_name'],
-                    element_type=element_data['element_type'],
-                    current_value=element_data['current_value'],
-                    description=element_data['description'],
-                    css_property=element_data['css_property'],
-                    importance=element_data['importance']
+                    element_data['component_name'],
+                    element_data['element_type'],
+                    element_data['current_value'],
+                    element_data['description'],
+                    element_data['css_property'],
+                    element_data['importance']
                 )
-                
+
                 modification = UIModification(
-                    element=element,
-                    new_value=mod_data['new_value'],
-                    reasoning=mod_data['reasoning'],
-                    priority=mod_data['priority']
+                    element,
+                    mod_data['new_value'],
+                    mod_data['reasoning'],
+                    mod_data['priority']
                 )
                 modifications.append(modification)
             
@@ -254,45 +658,11 @@ class UIAccessibilityAnalyzer:
     
     def _create_fallback_profile(self, disability_type: DisabilityType) -> AccessibilityProfile:
         """Create a fallback profile when GPT analysis fails"""
-        # Basic fallback modifications based on common accessibility guidelines
-        fallback_modifications = {
-            DisabilityType.LOW_VISION: [
-                UIModification(
-                    element=UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
-                    new_value="text-xl",
-                    reasoning="Larger text for better readability",
-                    priority=1
-                ),
-                UIModification(
-                    element=UIElement("primary", "color", "hsl(336 75% 45%)", "Primary brand color", "color", "high"),
-                    new_value="hsl(50 100% 60%)",
-                    reasoning="High contrast yellow for better visibility",
-                    priority=1
-                )
-            ],
-            DisabilityType.DYSLEXIA: [
-                UIModification(
-                    element=UIElement("body", "text", "text-lg", "Body text", "font-size", "high"),
-                    new_value="text-xl leading-relaxed",
-                    reasoning="Larger text with increased line spacing for dyslexia",
-                    priority=1
-                )
-            ],
-            DisabilityType.COGNITIVE_IMPAIRMENT: [
-                UIModification(
-                    element=UIElement("grid", "layout", "grid md:grid-cols-3 gap-8", "Grid layout", "display", "high"),
-                    new_value="grid md:grid-cols-2 gap-12",
-                    reasoning="Simplified layout with fewer columns and more spacing",
-                    priority=1
-                )
-            ]
-        }
-        
-        modifications = fallback_modifications.get(disability_type, [])
-        
+        # Basic fallback modifications based on common accessibility
+        # guidelines, looked up from the precomputed table
         return AccessibilityProfile(
             disability_type=disability_type,
-            modifications=modifications,
+            modifications=list(_FALLBACKS.get(disability_type, ())),
             css_classes=[f"persona-{disability_type.value}"],
             content_adaptations=["Use fallback profile - manual review recommended"],
             summary=f"Fallback profile for {disability_type.value} - GPT analysis failed"
@@ -300,84 +670,78 @@ class UIAccessibilityAnalyzer:
     
     def generate_css_modifications(self, profile: AccessibilityProfile) -> str:
         """Generate CSS code for the accessibility modifications"""
-        css_lines = []
-        
-        # Add persona class
-        persona_class = f".persona-{profile.disability_type.value.replace('_', '-')}"
-        css_lines.append(f"{persona_class} {{")
-        
-        # Group modifications by CSS property
-        property_groups = {}
-        for mod in profile.modifications:
-            prop = mod.element.css_property
-            if prop not in property_groups:
-                property_groups[prop] = []
-            property_groups[prop].append(mod)
-        
-        # Generate CSS for each property group
-        for prop, mods in property_groups.items():
-            if prop == "font-size":
-                for mod in mods:
-                    css_lines.append(f"  font-size: {mod.new_value};")
-            elif prop == "color":
-                for mod in mods:
-                    css_lines.append(f"  color: {mod.new_value};")
-            elif prop == "background-color":
-                for mod in mods:
-                    css_lines.append(f"  background-color: {mod.new_value};")
-            elif prop == "padding":
-                for mod in mods:
-                    css_lines.append(f"  padding: {mod.new_value};")
-            elif prop == "margin":
-                for mod in mods:
-                    css_lines.append(f"  margin: {mod.new_value};")
-            elif prop == "gap":
-                for mod in mods:
-                    css_lines.append(f"  gap: {mod.new_value};")
-            elif prop == "display":
-                for mod in mods:
-                    css_lines.append(f"  display: {mod.new_value};")
-            elif prop == "font-weight":
-                for mod in mods:
-                    css_lines.append(f"  font-weight: {mod.new_value};")
-            elif prop == "line-height":
-                for mod in mods:
-                    css_lines.append(f"  line-height: {mod.new_value};")
-            elif prop == "text-decoration":
-                for mod in mods:
-                    css_lines.append(f"  text-decoration: {mod.new_value};")
-            elif prop == "box-shadow":
-                for mod in mods:
-                    css_lines.append(f"  box-shadow: {mod.new_value};")
-            elif prop == "border-color":
-                for mod in mods:
-                    css_lines.append(f"  border-color: {mod.new_value};")
-        
-        css_lines.append("}")
-        
-        return "\n".join(css_lines)
+        # The columnar table owns the grouping and emission, so this and
+        # ModificationTable.to_css can't drift apart
+        return ModificationTable(profile).to_css(profile.disability_type)
     
     def generate_react_modifications(self, profile: AccessibilityProfile) -> Dict[str, Any]:
         """Generate React component modifications"""
-        modifications = {
-            "className_modifications": {},
-            "style_modifications": {},
+        # defaultdicts collapse the check-then-insert pattern to a single
+        # lookup per modification
+        style_mods: Dict[str, Dict[str, str]] = defaultdict(dict)
+        class_mods: Dict[str, List[str]] = defaultdict(list)
+
+        mod: UIModification
+        for mod in profile.modifications:
+            component: str = mod.element.component_name
+            prop: str = mod.element.css_property
+
+            if prop in _STYLE_PROPS:
+                style_mods[component][prop] = mod.new_value
+            elif prop in _CLASS_PROPS:
+                class_mods[component].append(mod.new_value)
+
+        return {
+            "className_modifications": dict(class_mods),
+            "style_modifications": dict(style_mods),
             "component_props": {},
             "content_changes": profile.content_adaptations
         }
-        
-        for mod in profile.modifications:
-            component = mod.element.component_name
-            prop = mod.element.css_property
-            
-            if prop in ["font-size", "color", "background-color", "padding", "margin"]:
-                if component not in modifications["style_modifications"]:
-                    modifications["style_modifications"][component] = {}
-                modifications["style_modifications"][component][prop] = mod.new_value
-            
-            elif prop in ["display", "gap"]:
-                if component not in modifications["className_modifications"]:
-                    modifications["className_modifications"][component] = []
-                modifications["className_modifications"][component].append(mod.new_value)
-        
-        return modifications
+
+
+async def main():
+    """Analyze all disability types concurrently"""
+    # Get API key from environment variable
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("Error: OPENAI_API_KEY environment variable not set")
+        return
+
+    # Initialize analyzer
+    analyzer = UIAccessibilityAnalyzer(api_key)
+
+    # Fire all analyses at once; wall time is bounded by the slowest
+    # OpenAI call instead of the sum of all of them
+    disability_types = list(DisabilityType)
+    profiles = await asyncio.gather(
+        *[analyzer.analyze_disability_type_async(dt) for dt in disability_types],
+        return_exceptions=True
+    )
+
+    for disability_type, profile in zip(disability_types, profiles):
+        print(f"\n{'='*60}")
+        print(f"Analysis for: {disability_type.value}")
+        print(f"{'='*60}")
+
+        if isinstance(profile, Exception):
+            print(f"Analysis failed: {profile}")
+            continue
+
+        # Print summary
+        print(f"\nSummary: {profile.summary}")
+        print(f"\nNumber of modifications: {len(profile.modifications)}")
+        print(f"CSS classes to add: {profile.css_classes}")
+        print(f"Content adaptations: {len(profile.content_adaptations)}")
+
+        # Print high priority modifications
+        high_priority = [mod for mod in profile.modifications if mod.priority <= 2]
+        if high_priority:
+            print(f"\nHigh Priority Modifications:")
+            for mod in high_priority:
+                print(f"- {mod.element.component_name}.{mod.element.css_property}: {mod.element.current_value} → {mod.new_value}")
+                print(f"  Reason: {mod.reasoning}")
+
+        print(f"\nAnalysis complete for {disability_type.value}")
+
+if __name__ == "__main__":
+    asyncio.run(main())